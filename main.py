@@ -4,13 +4,17 @@ from typing import Callable, Optional
 
 import flet as ft
 
+_VALID_COLORS = frozenset(ft.colors.colors_list)
+
 
 class Player:
+    __slots__ = ("name", "color")
+
     def __init__(self, name: str, color: str | None = None) -> None:
         self.name = name
         if color is None:
             self.color = ft.colors.random_color()
-        elif color in ft.colors.colors_list:
+        elif color in _VALID_COLORS:
             self.color = color
         else:
             raise ValueError(f"{color} is not a valid color!")
@@ -47,6 +51,10 @@ class Point(ft.IconButton):
         visual_density: Optional[ft.ThemeVisualDensity] = None,
         on_focus: ft.OptionalEventCallable = None,
         on_blur: ft.OptionalEventCallable = None,
+        row: int | None = None,
+        column: int | None = None,
+        owner: Player | None = None,
+        cell_index: int | None = None,
     ) -> None:
         super().__init__()
         self.selected = selected
@@ -75,14 +83,48 @@ class Point(ft.IconButton):
         self.icon_color = icon_color or ft.colors.WHITE
         self.icon = icon or ft.icons.CIRCLE
         self.icon_size = icon_size or 100
-
-    def initial(self, row: int, column: int, owner: Player | None = None):
         # Child attributes
-        self.row: int = row
-        self.column: int = column
+        self.row: int | None = row
+        self.column: int | None = column
+        # Position on the board's bitmasks (row * board size + column)
+        self.cell_index: int | None = cell_index
+        self.cell_bit: int | None = None if cell_index is None else 1 << cell_index
 
         self.owner: Player | None = owner
 
+    def copy_kwargs(self) -> dict:
+        # Constructor arguments to build a fresh point looking like this one
+        return {
+            name: getattr(self, name)
+            for name in (
+                "icon",
+                "icon_color",
+                "icon_size",
+                "selected",
+                "selected_icon",
+                "selected_icon_color",
+                "bgcolor",
+                "highlight_color",
+                "style",
+                "content",
+                "autofocus",
+                "disabled_color",
+                "hover_color",
+                "focus_color",
+                "splash_color",
+                "splash_radius",
+                "alignment",
+                "padding",
+                "enable_feedback",
+                "url",
+                "url_target",
+                "mouse_cursor",
+                "visual_density",
+                "on_focus",
+                "on_blur",
+            )
+        }
+
     def set_owner(self, player: Player):
         self.owner = player
         return self
@@ -96,6 +138,8 @@ class GameBoard_Event:
     DRAW = "DRAW"
     NOTHING = "NOTHING"
 
+    __slots__ = ("status", "player", "point")
+
     def __init__(self, status: str, player: Player, point: Point) -> None:
         self.status = status
         self.player: Player = player
@@ -125,31 +169,49 @@ class GameBoard(ft.Container):
             # if players_length == 0:
             raise Exception("You need two players at least!")
 
-        self._players: dict[Player, list[Point]] = {}
-        self._point_sample = point_sample
+        # Player state is kept in lists indexed by the player index
+        self._player_index: dict[Player, int] = {}
+        # Selected cells of each player as one bitmask (bit row * size + column)
+        self._occupancy: list[int] = []
+        self._default_icon_color = point_sample.icon_color
         self._board_size = board_size
         self._points: list[Point] = []
+        self._total_cells = board_size * board_size
+        # Win masks of the lines (row, column, diagonals) through each cell
+        self._cell_lines: list[tuple[int, ...]] = []
+        self._build_win_lines()
+        self._filled = 0  # count of selected points
         self._turn: Player
+        self._initial_turn = turn
         for player in players:
             self._add_player(player)
+        # Players never change after construction, cache their order once
+        self._players_tuple: tuple[Player, ...] = tuple(self._player_index)
 
         self._set_turn(turn)
         # Parent attributes
         self.content = ft.Column(controls=[])
+        sample_kwargs = point_sample.copy_kwargs()
+        # Mutable values are copied per point so points never share them
+        sample_style = sample_kwargs.pop("style")
+        sample_content = sample_kwargs.pop("content")
         for row in range(self.board_size):
             row_list = ft.Row(controls=[])
             for column in range(self.board_size):
-                point = deepcopy(self._point_sample)
-                point.initial(row, column)
+                point = Point(
+                    row=row,
+                    column=column,
+                    cell_index=row * self.board_size + column,
+                    style=deepcopy(sample_style),
+                    content=deepcopy(sample_content),
+                    **sample_kwargs,
+                )
                 point.on_click = on_click
 
                 row_list.controls.append(point)
                 self._points.append(point)
 
             self.content.controls.append(row_list)
-        # Save GameBoard backup
-        self._backup_content = deepcopy(self.content)
-        self._backup__players = deepcopy(self._players)
 
     @property
     def board_size(self):
@@ -161,18 +223,31 @@ class GameBoard(ft.Container):
 
     @property
     def all_players(self):
-        return list(self._players.keys())
+        return self._players_tuple
 
     def _player_exist(self, player: Player) -> bool:
-        if self._players.get(player, None) is None:
-            return False
-        return True
+        return player in self._player_index
 
     def _add_player(self, player: Player):
         if self._player_exist(player):
             raise KeyError(f"{player} added before!")
 
-        self._players.setdefault(player, [])
+        self._player_index[player] = len(self._occupancy)
+        self._occupancy.append(0)
+
+    def _build_win_lines(self):
+        size = self.board_size
+        lines = [[(row, column) for column in range(size)] for row in range(size)]
+        lines += [[(row, column) for row in range(size)] for column in range(size)]
+        lines.append([(index, index) for index in range(size)])
+        lines.append([(index, size - 1 - index) for index in range(size)])
+
+        cell_lines: list[list[int]] = [[] for _ in range(self._total_cells)]
+        for line in lines:
+            win_mask = sum(1 << (row * size + column) for row, column in line)
+            for row, column in line:
+                cell_lines[row * size + column].append(win_mask)
+        self._cell_lines = [tuple(masks) for masks in cell_lines]
 
     def _set_turn(self, player: Player | None):
         if player is None:
@@ -183,43 +258,24 @@ class GameBoard(ft.Container):
 
         self._turn = player
 
-    def _longest_consecutive(self, nums: list[int]) -> bool:
-        num_set = set(nums)
-        longest_streak = 0
-
-        for num in num_set:
-            if num - 1 not in num_set:
-                current_num = num
-                current_streak = 1
-
-                while current_num + 1 in num_set:
-                    current_num += 1
-                    current_streak += 1
-
-                longest_streak = max(longest_streak, current_streak)
-                if longest_streak >= self.board_size:
-                    return True
+    def _win_position_check(self, occupancy: int, point: Point) -> bool:
+        # Only the row, column and diagonals through the selected point can be
+        # new wins, off-diagonal points never test a diagonal mask
+        for win_mask in self._cell_lines[point.cell_index]:
+            if occupancy & win_mask == win_mask:
+                return True
         return False
 
-    def _win_position_check(self, player: Player) -> bool:
-        if not self._player_exist(player):
-            raise IndexError(f"{player} are'nt in this GameBoard!")
-
-        player_points: list[Point] = self._players[player]
+    def reset(self):
+        # Reuse the existing points instead of rebuilding the board
+        for point in self._points:
+            point.owner = None
+            point.icon_color = self._default_icon_color
 
-        horizontal_state: dict[int, list[int]] = {}
-        vertical_state: dict[int, list[int]] = {}
+        self._occupancy = [0] * len(self._players_tuple)
 
-        for point in player_points:
-            row, column = point.row, point.column
-            horizontal_state[row] = horizontal_state.get(row, []) + [column]
-            vertical_state[column] = vertical_state.get(column, []) + [row]
-
-        for chain in [list(horizontal_state.values()), list(vertical_state.values())]:
-            for consecutive in chain:
-                if self._longest_consecutive(consecutive):
-                    return True
-        return False
+        self._filled = 0
+        self._set_turn(self._initial_turn)
 
     def get_point(self, row: int, column: int) -> Point:
         return self._points[row * self.board_size + column]
@@ -236,33 +292,39 @@ class GameBoard(ft.Container):
             if player != self._turn:
                 raise Exception(f"{player} is not your turn!")
 
-        if point not in self._points:
+        # Bounds plus identity check instead of scanning every point, a point
+        # without a board position is out of this GameBoard too
+        cell_index = getattr(point, "cell_index", None)
+        if not (
+            cell_index is not None
+            and 0 <= cell_index < self._total_cells
+            and self._points[cell_index] is point
+        ):
             raise IndexError(f"{point} out of GameBoard!")
 
         if point.owner is not None:
             raise Exception(f"{point} is already selected!")
 
-        all_players = self.all_players
-        player_index = all_players.index(player)
+        player_index = self._player_index[player]
+        # Wrap around to the first player after the last one
+        next_player_index = (player_index + 1) % len(self._players_tuple)
 
-        next_player_index = player_index + 1
-        if next_player_index == len(self._players):  # if turn is last player
-            next_player_index = 0  # set turn to first player
-
-        self._set_turn(self.all_players[next_player_index])
-        self._players[player].append(point.set_owner(player))
+        # The index is always valid, no need for _set_turn checks
+        self._turn = self._players_tuple[next_player_index]
+        point.set_owner(player)
+        self._filled += 1
+        occupancy = self._occupancy[player_index] | point.cell_bit
+        self._occupancy[player_index] = occupancy
 
         status = GameBoard_Event.NOTHING  # default status
         # Get count of this player selected points >= GameBoard size
-        if len(self._players[player]) >= self.board_size:
-            if self._win_position_check(player):
-                status = GameBoard_Event.WIN
-            # if all points are selected
-            elif (
-                sum(1 for point in self._points if point.owner is not None)
-                == self.board_size**2
-            ):
-                status = GameBoard_Event.DRAW
+        if occupancy.bit_count() >= self.board_size and self._win_position_check(
+            occupancy, point
+        ):
+            status = GameBoard_Event.WIN
+        # if all points are selected
+        elif self._filled == self._total_cells:
+            status = GameBoard_Event.DRAW
 
         return GameBoard_Event(status, player, point)
 
@@ -274,43 +336,27 @@ game_board_size: int = 3
 
 
 def listener(e: ft.ControlEvent):
-    global game_board
     point: Point = e.control
     point.icon_color = game_board.turn.color
 
     g_b_e: GameBoard_Event = game_board.select_point(point)
-    turn_bar.controls = [
-        ft.Text("Turn:"),
-        ft.Text(game_board.turn.name, color=game_board.turn.color),
-    ]
-    row_content = ft.Row(controls=[], alignment=ft.MainAxisAlignment.CENTER, scale=3)
-    dlg = ft.AlertDialog(
-        content=ft.Column(
-            controls=[row_content],
-            alignment=ft.MainAxisAlignment.CENTER,
-            height=80,
-            width=100,
-        )
-    )
+    turn_name.value = game_board.turn.name
+    turn_name.color = game_board.turn.color
+    if g_b_e.status == GameBoard_Event.NOTHING:
+        return e.page.update()
 
     match g_b_e.status:
         case GameBoard_Event.WIN:
             player_txt = ft.Text(g_b_e.player.name, color=g_b_e.player.color)
-            row_content.controls = [player_txt, ft.Text("Win!")]
+            end_row.controls = [player_txt, ft.Text("Win!")]
         case GameBoard_Event.DRAW:
-            row_content.controls = [ft.Text("Draw!", color=ft.colors.LIGHT_BLUE_400)]
-        case GameBoard_Event.NOTHING:
-            return e.page.update()
-
-    e.page.clean()
-    game_board = deepcopy(game_board_backup)
-    turn_bar.controls = [
-        ft.Text("Turn:"),
-        ft.Text(game_board.turn.name, color=game_board.turn.color),
-    ]
-    e.page.add(turn_bar, ft.Divider(), game_board)
+            end_row.controls = [ft.Text("Draw!", color=ft.colors.LIGHT_BLUE_400)]
+
+    game_board.reset()
+    turn_name.value = game_board.turn.name
+    turn_name.color = game_board.turn.color
     e.page.update()
-    e.page.open(dlg)
+    e.page.open(end_dialog)
 
 
 point_sample = Point(icon_color=ft.colors.GREEN_200)
@@ -320,16 +366,22 @@ game_board = GameBoard(
     on_click=listener,
     point_sample=point_sample,
 )
+turn_label = ft.Text("Turn:")
+turn_name = ft.Text(game_board.turn.name, color=game_board.turn.color)
 turn_bar = ft.Row(
-    controls=[
-        ft.Text("Turn:"),
-        ft.Text(game_board.turn.name, color=game_board.turn.color),
-    ],
+    controls=[turn_label, turn_name],
     alignment=ft.MainAxisAlignment.CENTER,
     scale=3,
 )
 game = turn_bar, ft.Divider(), game_board
-game_board_backup = deepcopy(game_board)
+end_row = ft.Row(controls=[], alignment=ft.MainAxisAlignment.CENTER, scale=3)
+end_column = ft.Column(
+    controls=[end_row],
+    alignment=ft.MainAxisAlignment.CENTER,
+    height=80,
+    width=100,
+)
+end_dialog = ft.AlertDialog(content=end_column)
 
 
 def main(page: ft.Page):